@@ -1,6 +1,8 @@
 from django.test import Client, TestCase
 from django.urls import reverse
 
+from apps.query_budget.budget import query_budget
+
 
 class HealthCheckViewTest(TestCase):
     def setUp(self):
@@ -16,3 +18,8 @@ class HealthCheckViewTest(TestCase):
         # Assert
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_health_check_query_budget(self):
+        with query_budget("health:health-check"):
+            response = self.client.get(reverse("health-check"))
+            self.assertEqual(response.status_code, 200)
@@ -0,0 +1,109 @@
+import threading
+from typing import Any
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+DEFAULT_LANE = "default"
+
+
+class Lane:
+    """
+    Caps the number of in-flight requests of a route class in this worker
+    and counts how many had to wait or were shed.
+    """
+
+    def __init__(self, name: str, limit: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self.semaphore = threading.BoundedSemaphore(limit)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.waiting = 0
+        self.queued = 0
+        self.served = 0
+        self.failed = 0
+        self.shed = 0
+
+    def acquire(self) -> bool:
+        """
+        Takes a slot, waiting at most queue_timeout seconds for one to be
+        released. Returns False when the request should be shed.
+        """
+        if self.semaphore.acquire(blocking=False):
+            self._count_acquired()
+            return True
+
+        with self.lock:
+            self.waiting += 1
+            self.queued += 1
+        acquired = self.semaphore.acquire(timeout=self.queue_timeout)
+        with self.lock:
+            self.waiting -= 1
+            if not acquired:
+                self.shed += 1
+        if acquired:
+            self._count_acquired()
+        return acquired
+
+    def release(self, failed: bool = False):
+        with self.lock:
+            self.in_flight -= 1
+            if failed:
+                self.failed += 1
+            else:
+                self.served += 1
+        self.semaphore.release()
+
+    def metrics(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "queued": self.queued,
+                "served": self.served,
+                "failed": self.failed,
+                "shed": self.shed,
+            }
+
+    def _count_acquired(self):
+        with self.lock:
+            self.in_flight += 1
+
+
+_lanes: dict[str, Lane] | None = None
+_lanes_lock = threading.Lock()
+
+
+def get_lanes() -> dict[str, Lane]:
+    global _lanes
+    with _lanes_lock:
+        if _lanes is None:
+            _lanes = {
+                name: Lane(name, options["LIMIT"], options["QUEUE_TIMEOUT"])
+                for name, options in settings.LOAD_SHEDDING_LANES.items()
+            }
+        return _lanes
+
+
+def get_lane(path: str) -> Lane:
+    """
+    Returns the lane of the first LOAD_SHEDDING_ROUTES prefix matching the
+    path, or the default lane.
+    """
+    lanes = get_lanes()
+    for prefix, name in settings.LOAD_SHEDDING_ROUTES.items():
+        if path.startswith(prefix):
+            return lanes[name]
+    return lanes[DEFAULT_LANE]
+
+
+@receiver(setting_changed)
+def reset_lanes(setting: str, **kwargs: Any):
+    global _lanes
+    if setting in ("LOAD_SHEDDING_LANES", "LOAD_SHEDDING_ROUTES"):
+        with _lanes_lock:
+            _lanes = None
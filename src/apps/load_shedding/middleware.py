@@ -0,0 +1,87 @@
+import logging
+from typing import Any, Callable, Iterable, Iterator
+
+from django.conf import settings
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+
+from .lanes import get_lane
+
+logger = logging.getLogger(__name__)
+
+
+class ReleasingIterator:
+    """
+    Wraps streaming content and releases the lane slot when the response is
+    closed, whether or not the body was fully consumed. Django calls close()
+    on streaming content when it closes the response.
+    """
+
+    def __init__(self, content: Iterable[Any], release: Callable[[], None]):
+        self.content = iter(content)
+        self.release = release
+        self.released = False
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        return next(self.content)
+
+    def close(self):
+        if not self.released:
+            self.released = True
+            self.release()
+
+
+class LoadSheddingMiddleware:
+    """
+    Routes each request to a lane with its own cap on in-flight requests.
+    Requests that cannot get a slot within the lane's queue timeout are
+    answered right away with 503 and Retry-After instead of piling up in
+    the worker. Health checks and the admin use a reserved lane so they are
+    still served while the API lane is saturated.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        lane = get_lane(request.path_info)
+        if not lane.acquire():
+            logger.warning(
+                "Shed %s %s from lane %s",
+                request.method,
+                request.path,
+                lane.name,
+            )
+            return JsonResponse(
+                {"detail": "Servidor sobrecarregado, tente novamente."},
+                status=503,
+                headers={
+                    "Retry-After": str(settings.LOAD_SHEDDING_RETRY_AFTER)
+                },
+            )
+
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            lane.release(failed=True)
+            raise
+
+        failed = response.status_code >= 500
+        if isinstance(response, StreamingHttpResponse) and isinstance(
+            response.streaming_content, Iterable
+        ):
+            # Keep the slot until the streamed body has been sent. Async
+            # streams are not wrapped and release it right away.
+            response.streaming_content = ReleasingIterator(
+                response.streaming_content, lambda: lane.release(failed)
+            )
+        else:
+            lane.release(failed)
+        return response
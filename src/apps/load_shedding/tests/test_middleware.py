@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+from django.http import StreamingHttpResponse
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from apps.load_shedding.lanes import get_lanes, reset_lanes
+from apps.users.tests.utils import StaffAPITestCase
+
+LANES = {
+    "default": {"LIMIT": 1, "QUEUE_TIMEOUT": 0},
+    "reserved": {"LIMIT": 1, "QUEUE_TIMEOUT": 0},
+}
+
+
+@override_settings(LOAD_SHEDDING_LANES=LANES)
+class LoadSheddingMiddlewareTests(StaffAPITestCase):
+    def setUp(self):
+        super().setUp()
+        reset_lanes(setting="LOAD_SHEDDING_LANES")
+
+    def test_sheds_requests_when_lane_is_full(self):
+        lane = get_lanes()["default"]
+        lane.acquire()
+        try:
+            with self.assertLogs("apps.load_shedding", "WARNING"):
+                response = self.client.get(reverse("user-list"))
+        finally:
+            lane.release()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+        self.assertEqual(lane.metrics()["shed"], 1)
+        self.assertEqual(lane.metrics()["queued"], 1)
+
+    def test_health_check_uses_reserved_lane(self):
+        lane = get_lanes()["default"]
+        lane.acquire()
+        try:
+            response = self.client.get(reverse("health-check"))
+        finally:
+            lane.release()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_lanes()["reserved"].metrics()["served"], 1)
+
+    def test_streaming_response_holds_slot_until_closed(self):
+        response = self.client.get(
+            reverse("user-export"), headers=self.headers
+        )
+        lane = get_lanes()["default"]
+        self.assertEqual(lane.metrics()["in_flight"], 1)
+
+        assert isinstance(response, StreamingHttpResponse)
+        response.getvalue()
+
+        self.assertEqual(lane.metrics()["in_flight"], 0)
+
+    def test_metrics(self):
+        response = self.client.get(
+            reverse("load-shedding-metrics"), headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.json()["default"]),
+            {
+                "limit",
+                "in_flight",
+                "waiting",
+                "queued",
+                "served",
+                "failed",
+                "shed",
+            },
+        )
+        self.assertEqual(response.json()["reserved"]["in_flight"], 1)
+
+    def test_unconsumed_streaming_response_releases_slot_on_close(self):
+        response = self.client.get(
+            reverse("user-export"), headers=self.headers
+        )
+
+        response.close()
+
+        lane = get_lanes()["default"]
+        self.assertEqual(lane.metrics()["in_flight"], 0)
+        self.assertEqual(lane.metrics()["served"], 1)
+
+    def test_server_errors_are_counted_as_failed(self):
+        with patch(
+            "apps.health.views.HealthCheckSerializer",
+            side_effect=RuntimeError,
+        ):
+            client = Client(raise_request_exception=False)
+            response = client.get(reverse("health-check"))
+
+        self.assertEqual(response.status_code, 500)
+        metrics = get_lanes()["reserved"].metrics()
+        self.assertEqual((metrics["served"], metrics["failed"]), (0, 1))
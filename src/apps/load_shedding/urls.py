@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import LoadSheddingMetricsView
+
+urlpatterns = [
+    path(
+        "load-shedding/metrics",
+        LoadSheddingMetricsView.as_view(),
+        name="load-shedding-metrics",
+    )
+]
@@ -0,0 +1,26 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .lanes import get_lanes
+
+
+@extend_schema(
+    summary="Load shedding metrics",
+    responses=OpenApiTypes.OBJECT,
+    tags=["Health"],
+)
+class LoadSheddingMetricsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, _: Request):
+        """
+        Returns in-flight, waiting, queued, served, failed and shed request
+        counters of each lane in the worker that served the request
+        """
+        return Response(
+            {name: lane.metrics() for name, lane in get_lanes().items()}
+        )
@@ -0,0 +1,27 @@
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from apps.profiling.middleware import make_token
+
+
+class Command(BaseCommand):
+    help = "Creates a signed token that enables profiling of a request"
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("email", help="Email of a staff user")
+
+    def handle(self, *args: Any, **options: Any):
+        user = (
+            get_user_model()
+            .objects.filter(email=options["email"], is_staff=True)
+            .first()
+        )
+        if user is None:
+            raise CommandError("Staff user not found.")
+        self.stdout.write(make_token(user.pk))
@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+from .recorder import QueryRecorder
+from .reports import save_report
+from .sampler import ThreadSampler
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_PARAM = "_profile"
+REPORT_HEADER = "X-Profile-Report"
+TOKEN_SALT = "apps.profiling"
+STATS_LIMIT = 60
+SAMPLE_INTERVAL = 0.001
+
+# Bounds the sampling overhead to a single request per worker
+PROFILER_LOCK = threading.Lock()
+
+
+def make_token(user_pk: int) -> str:
+    return signing.dumps({"uid": user_pk}, salt=TOKEN_SALT)
+
+
+def is_valid_token(token: str) -> bool:
+    """
+    Accepts tokens signed by make_token for a user that is still staff.
+    """
+    try:
+        payload = signing.loads(
+            token,
+            salt=TOKEN_SALT,
+            max_age=settings.PROFILING_TOKEN_MAX_AGE,
+        )
+    except signing.BadSignature:
+        return False
+    return (
+        get_user_model()
+        .objects.filter(pk=payload.get("uid"), is_staff=True)
+        .exists()
+    )
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a single request when it carries a signed X-Profile header or
+    _profile query parameter, and stores the result in the on-disk ring of
+    reports browsable from the admin. Other requests only pay for the
+    header and query string lookup.
+
+    The request's thread is sampled from a helper thread instead of being
+    traced, so requests served concurrently by the same worker are not
+    slowed down and do not show up in the report. One request per worker
+    is profiled at a time, the others are served unprofiled.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        token = request.headers.get(PROFILE_HEADER) or request.GET.get(
+            PROFILE_PARAM
+        )
+        if not token or not is_valid_token(token):
+            return self.get_response(request)
+        if not PROFILER_LOCK.acquire(blocking=False):
+            return self.get_response(request)
+        try:
+            return self.profile(request)
+        finally:
+            PROFILER_LOCK.release()
+
+    def profile(self, request: HttpRequest) -> HttpResponse:
+        sampler = ThreadSampler(threading.get_ident(), SAMPLE_INTERVAL)
+        recorder = QueryRecorder()
+
+        start = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            sampler.start()
+            try:
+                response = self.get_response(request)
+            finally:
+                sampler.stop()
+        duration = (time.perf_counter() - start) * 1000
+
+        report_id = save_report(
+            {
+                "created_at": timezone.now().isoformat(),
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "duration": duration,
+                "queries": recorder.queries,
+                "stats": sampler.format_stats(STATS_LIMIT),
+            }
+        )
+        response[REPORT_HEADER] = report_id
+        return response
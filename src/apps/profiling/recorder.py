@@ -0,0 +1,30 @@
+import time
+from typing import Any, Callable
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper that records every statement and its duration.
+    """
+
+    def __init__(self):
+        self.queries: list[dict[str, Any]] = []
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "sql": sql,
+                    "duration": (time.perf_counter() - start) * 1000,
+                }
+            )
@@ -0,0 +1,72 @@
+import json
+import os
+import re
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+
+REPORT_ID_PATTERN = re.compile(r"^\d+-[0-9a-f]{8}$")
+SUMMARY_FIELDS = ["id", "created_at", "method", "path", "status", "duration"]
+
+
+def _reports_dir() -> Path:
+    path = Path(settings.PROFILING_REPORTS_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _report_files() -> list[Path]:
+    return sorted(_reports_dir().glob("*.json"))
+
+
+def save_report(report: dict[str, Any]) -> str:
+    """
+    Writes the report to disk and drops the oldest ones so that at most
+    PROFILING_MAX_REPORTS are kept.
+    """
+    report_id = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+    report = {"id": report_id, **report}
+    directory = _reports_dir()
+    # Write to a temporary file and move it into place so readers in other
+    # workers never see a partially written report
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, suffix=".tmp", delete=False
+    ) as temp_file:
+        json.dump(report, temp_file)
+    os.replace(temp_file.name, directory / f"{report_id}.json")
+
+    files = _report_files()
+    for old in files[: max(len(files) - settings.PROFILING_MAX_REPORTS, 0)]:
+        old.unlink(missing_ok=True)
+    return report_id
+
+
+def load_report(report_id: str) -> dict[str, Any] | None:
+    if not REPORT_ID_PATTERN.match(report_id):
+        return None
+    path = _reports_dir() / f"{report_id}.json"
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def list_reports() -> list[dict[str, Any]]:
+    """
+    Returns report summaries, newest first.
+    """
+    summaries: list[dict[str, Any]] = []
+    for path in reversed(_report_files()):
+        try:
+            report = json.loads(path.read_text())
+        except (OSError, ValueError):
+            # Pruned by another worker since it was listed, or corrupt
+            continue
+        summary = {field: report.get(field) for field in SUMMARY_FIELDS}
+        summary["query_count"] = len(report.get("queries", []))
+        summaries.append(summary)
+    return summaries
@@ -0,0 +1,70 @@
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+
+FunctionKey = tuple[str, int, str]
+
+
+class ThreadSampler:
+    """
+    Statistical profiler for a single thread. A helper thread reads the
+    target thread's current stack from sys._current_frames() every
+    `interval` seconds, so no tracing hook is installed and the other
+    threads of the process are neither slowed down nor reported.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.cumulative: Counter[FunctionKey] = Counter()
+        self.own: Counter[FunctionKey] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frames = sys._current_frames()  # pyright: ignore[reportPrivateUsage]
+            frame = frames.get(self.thread_id)
+            if frame is not None:
+                self._sample(frame)
+
+    def _sample(self, frame: FrameType):
+        self.samples += 1
+        self.own[_function_key(frame)] += 1
+        seen: set[FunctionKey] = set()
+        current: FrameType | None = frame
+        while current is not None:
+            key = _function_key(current)
+            # Recursive calls count once per sample
+            if key not in seen:
+                seen.add(key)
+                self.cumulative[key] += 1
+            current = current.f_back
+
+    def format_stats(self, limit: int) -> str:
+        lines = [
+            f"{self.samples} samples every {self.interval * 1000:g} ms, "
+            "ordered by cumulative samples",
+            "",
+            f"{'cumulative':>10}  {'own':>6}  function",
+        ]
+        for key, count in self.cumulative.most_common(limit):
+            filename, lineno, name = key
+            lines.append(
+                f"{count:>10}  {self.own[key]:>6}  {filename}:{lineno}({name})"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _function_key(frame: FrameType) -> FunctionKey:
+    code = frame.f_code
+    return code.co_filename, code.co_firstlineno, code.co_name
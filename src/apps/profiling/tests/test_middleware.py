@@ -0,0 +1,126 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from apps.profiling.middleware import PROFILER_LOCK, make_token
+from apps.profiling.reports import list_reports, load_report
+from apps.users.tests.utils import create_staff_user
+
+
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        self.reports_dir = tempfile.TemporaryDirectory()
+        self.reports_settings = override_settings(
+            PROFILING_REPORTS_DIR=self.reports_dir.name,
+            PROFILING_MAX_REPORTS=2,
+        )
+        self.reports_settings.enable()
+        self.client = Client()
+        self.url = reverse("health-check")
+        self.staff = create_staff_user()
+
+    def tearDown(self):
+        self.reports_settings.disable()
+        self.reports_dir.cleanup()
+
+    @patch("apps.profiling.middleware.save_report")
+    def test_untriggered_request_is_not_profiled(self, save_report: MagicMock):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Profile-Report", response)
+        save_report.assert_not_called()
+
+    def test_signed_header_profiles_request(self):
+        response = self.client.get(
+            self.url, headers={"X-Profile": make_token(self.staff.pk)}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        report = load_report(response["X-Profile-Report"])
+        assert report is not None
+        self.assertEqual(report["path"], self.url)
+        self.assertEqual(report["status"], 200)
+        self.assertIn("stats", report)
+
+    def test_concurrent_profiled_request_is_served_unprofiled(self):
+        with PROFILER_LOCK:
+            response = self.client.get(
+                self.url, headers={"X-Profile": make_token(self.staff.pk)}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Profile-Report", response)
+        self.assertEqual(list_reports(), [])
+
+    @patch("apps.users.serializers.send_mail")
+    def test_query_flag_records_sql(self, _: MagicMock):
+        token = make_token(self.staff.pk)
+        response = self.client.post(
+            f"{reverse('sign-up')}?_profile={token}",
+            {
+                "email": "test@example.com",
+                "first_name": "John",
+                "password": "securepassword123",
+            },
+            content_type="application/json",
+        )
+
+        report = load_report(response["X-Profile-Report"])
+        assert report is not None
+        self.assertTrue(report["queries"])
+
+    def test_invalid_or_non_staff_token_is_ignored(self):
+        self.staff.is_staff = False
+        self.staff.save()
+
+        for token in ["invalid", make_token(self.staff.pk)]:
+            response = self.client.get(self.url, headers={"X-Profile": token})
+            self.assertNotIn("X-Profile-Report", response)
+
+    def test_reports_are_kept_in_bounded_ring(self):
+        token = make_token(self.staff.pk)
+        report_ids = [
+            self.client.get(self.url, headers={"X-Profile": token})[
+                "X-Profile-Report"
+            ]
+            for _ in range(3)
+        ]
+
+        stored = [report["id"] for report in list_reports()]
+        self.assertEqual(stored, report_ids[:0:-1])
+
+    def test_reports_are_browsable_from_admin(self):
+        token = make_token(self.staff.pk)
+        report_id = self.client.get(self.url, headers={"X-Profile": token})[
+            "X-Profile-Report"
+        ]
+        self.client.force_login(self.staff)
+
+        list_response = self.client.get(reverse("profiling-report-list"))
+        detail_response = self.client.get(
+            reverse("profiling-report-detail", args=[report_id])
+        )
+
+        self.assertContains(list_response, report_id)
+        self.assertContains(detail_response, "cumulative")
+
+    def test_admin_views_require_staff(self):
+        response = self.client.get(reverse("profiling-report-list"))
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_unreadable_reports_are_skipped(self):
+        token = make_token(self.staff.pk)
+        report_id = self.client.get(self.url, headers={"X-Profile": token})[
+            "X-Profile-Report"
+        ]
+        Path(self.reports_dir.name, "1-00000000.json").write_text("{")
+
+        self.assertEqual(
+            [report["id"] for report in list_reports()], [report_id]
+        )
+        self.assertIsNone(load_report("1-00000000"))
@@ -0,0 +1,39 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from apps.profiling.sampler import ThreadSampler
+
+
+def spin(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def spin_in_other_thread(stopped: threading.Event):
+    while not stopped.is_set():
+        spin(0.001)
+
+
+class ThreadSamplerTests(SimpleTestCase):
+    def test_samples_only_the_target_thread(self):
+        stopped = threading.Event()
+        other = threading.Thread(target=spin_in_other_thread, args=[stopped])
+        other.start()
+        sampler = ThreadSampler(threading.get_ident(), 0.001)
+        sampler.start()
+        try:
+            spin(0.2)
+        finally:
+            sampler.stop()
+            stopped.set()
+            other.join()
+
+        self.assertGreater(sampler.samples, 0)
+        names = {name for _, _, name in sampler.cumulative}
+        self.assertIn("spin", names)
+        self.assertIn("test_samples_only_the_target_thread", names)
+        self.assertNotIn("spin_in_other_thread", names)
+        self.assertIn("(spin)", sampler.format_stats(100))
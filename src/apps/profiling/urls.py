@@ -0,0 +1,17 @@
+from django.contrib import admin
+from django.urls import path
+
+from .views import report_detail, report_list
+
+urlpatterns = [
+    path(
+        "",
+        admin.site.admin_view(report_list),
+        name="profiling-report-list",
+    ),
+    path(
+        "<str:report_id>",
+        admin.site.admin_view(report_detail),
+        name="profiling-report-detail",
+    ),
+]
@@ -0,0 +1,29 @@
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import render
+
+from .reports import list_reports, load_report
+
+
+def report_list(request: HttpRequest) -> HttpResponse:
+    """
+    Lists the stored profiling reports, newest first
+    """
+    return render(
+        request,
+        "profiling/report_list.html",
+        {"title": "Profiling reports", "reports": list_reports()},
+    )
+
+
+def report_detail(request: HttpRequest, report_id: str) -> HttpResponse:
+    """
+    Shows the SQL statements and profiler output of a single report
+    """
+    report = load_report(report_id)
+    if report is None:
+        raise Http404("Relatório não encontrado.")
+    return render(
+        request,
+        "profiling/report_detail.html",
+        {"title": f"{report['method']} {report['path']}", "report": report},
+    )
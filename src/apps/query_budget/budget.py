@@ -0,0 +1,136 @@
+import json
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Generator
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connection
+
+from apps.profiling.recorder import QueryRecorder
+
+RECORD_ENV_VAR = "QUERY_BUDGET_RECORD"
+
+IN_LIST_PATTERN = re.compile(r"IN \((?:%s, )*%s\)")
+STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+NUMBER_PATTERN = re.compile(r"\b\d+\b")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Reduces a statement to its shape, so queries that only differ in their
+    parameters or in the size of an IN list are considered the same.
+    """
+    sql = IN_LIST_PATTERN.sub("IN (...)", sql)
+    sql = STRING_PATTERN.sub("?", sql)
+    return NUMBER_PATTERN.sub("?", sql)
+
+
+def find_repeated_queries(queries: list[dict[str, Any]]) -> dict[str, int]:
+    """
+    Returns the statements executed at least QUERY_BUDGET_REPEAT_THRESHOLD
+    times, which usually means a relation is being loaded row by row.
+    """
+    counts = Counter(normalize_sql(query["sql"]) for query in queries)
+    return {
+        sql: count
+        for sql, count in counts.items()
+        if count >= settings.QUERY_BUDGET_REPEAT_THRESHOLD
+    }
+
+
+def load_budgets() -> dict[str, int]:
+    path = Path(settings.QUERY_BUDGET_FILE)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def record_budget(name: str, query_count: int):
+    budgets = load_budgets()
+    budgets[name] = query_count
+    Path(settings.QUERY_BUDGET_FILE).write_text(
+        json.dumps(budgets, indent=2, sort_keys=True) + "\n"
+    )
+
+
+def check_budget(name: str, requests: list[list[dict[str, Any]]]):
+    """
+    Fails when the queries of a request contain an N+1 pattern or outnumber
+    the recorded baseline for `name`. When the QUERY_BUDGET_RECORD
+    environment variable is set, the baseline is updated instead.
+    """
+    for queries in requests:
+        repeated = find_repeated_queries(queries)
+        if repeated:
+            details = "\n".join(
+                f"  {count}x {sql}" for sql, count in repeated.items()
+            )
+            raise QueryBudgetExceeded(
+                f"Possible N+1 in {name}, similar queries repeated:\n{details}"
+            )
+
+    if os.environ.get(RECORD_ENV_VAR):
+        record_budget(name, max(len(queries) for queries in requests))
+        return
+
+    budget = load_budgets().get(name)
+    if budget is None:
+        raise QueryBudgetExceeded(
+            f"No query budget recorded for {name}. Run the tests with "
+            f"{RECORD_ENV_VAR}=1 to record it."
+        )
+    for queries in requests:
+        if len(queries) > budget:
+            statements = "\n".join(f"  {query['sql']}" for query in queries)
+            raise QueryBudgetExceeded(
+                f"{name} ran {len(queries)} queries, budget is {budget}:\n"
+                f"{statements}"
+            )
+
+
+class RequestQueryRecorder(QueryRecorder):
+    """
+    QueryRecorder that also keeps track of where each request starts, so
+    budgets apply per request when several are made in the same block.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.request_starts: list[int] = []
+
+    def start_request(self, **kwargs: Any):
+        self.request_starts.append(len(self.queries))
+
+    @property
+    def requests(self) -> list[list[dict[str, Any]]]:
+        starts = [0, *self.request_starts[1:]] if self.request_starts else [0]
+        ends = [*starts[1:], len(self.queries)]
+        return [self.queries[start:end] for start, end in zip(starts, ends)]
+
+
+@contextmanager
+def query_budget(
+    name: str,
+) -> Generator[RequestQueryRecorder, None, None]:
+    """
+    Records the queries run inside the block and checks those of each
+    request against the budget for `name`. Works around a single test
+    client call as well as a benchmark loop issuing many requests.
+    """
+    recorder = RequestQueryRecorder()
+    request_started.connect(recorder.start_request, weak=False)
+    try:
+        with connection.execute_wrapper(recorder):
+            yield recorder
+    finally:
+        request_started.disconnect(recorder.start_request)
+
+    check_budget(name, recorder.requests)
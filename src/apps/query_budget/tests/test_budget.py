@@ -0,0 +1,67 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from apps.query_budget.budget import (
+    QueryBudgetExceeded,
+    load_budgets,
+    normalize_sql,
+    query_budget,
+)
+from apps.users.models import CustomUser
+
+
+@patch.dict(os.environ, {"QUERY_BUDGET_RECORD": ""})
+class QueryBudgetTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.budget_file = Path(self.directory.name) / "budgets.json"
+        self.budget_file.write_text('{"users": 1}')
+        self.budget_settings = override_settings(
+            QUERY_BUDGET_FILE=self.budget_file
+        )
+        self.budget_settings.enable()
+
+    def tearDown(self):
+        self.budget_settings.disable()
+        self.directory.cleanup()
+
+    def test_normalize_sql(self):
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id IN (%s, %s) AND a = 'x'"),
+            normalize_sql("SELECT * FROM t WHERE id IN (%s) AND a = 'y'"),
+        )
+
+    def test_within_budget(self):
+        with query_budget("users") as recorder:
+            list(CustomUser.objects.all())
+
+        self.assertEqual(len(recorder.queries), 1)
+
+    def test_exceeds_budget(self):
+        with self.assertRaisesRegex(QueryBudgetExceeded, "budget is 1"):
+            with query_budget("users"):
+                list(CustomUser.objects.all())
+                CustomUser.objects.exists()
+
+    def test_missing_budget(self):
+        with self.assertRaisesRegex(QueryBudgetExceeded, "No query budget"):
+            with query_budget("unknown"):
+                pass
+
+    def test_detects_repeated_queries(self):
+        with self.assertRaisesRegex(QueryBudgetExceeded, "N\\+1"):
+            with query_budget("users"):
+                for pk in range(3):
+                    CustomUser.objects.filter(pk=pk).exists()
+
+    @patch.dict(os.environ, {"QUERY_BUDGET_RECORD": "1"})
+    def test_record_budget(self):
+        with query_budget("users"):
+            list(CustomUser.objects.all())
+            CustomUser.objects.exists()
+
+        self.assertEqual(load_budgets(), {"users": 2})
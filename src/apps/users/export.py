@@ -0,0 +1,93 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timedelta
+from typing import Any, Generator, Iterator
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from apps.users.models import CustomUser
+
+EXPORT_FIELDS = [
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_staff",
+    "date_joined",
+    "updated_at",
+    "profile_picture",
+]
+CHUNK_SIZE = 2000
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(updated_at: datetime, pk: int) -> str:
+    position = f"{updated_at.isoformat()}|{pk}"
+    return urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        updated_at, pk = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(updated_at), int(pk)
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursor("Cursor inválido.") from exc
+
+
+def export_users(
+    since: str | None = None,
+) -> Generator[str, None, None]:
+    """
+    Returns an iterator of NDJSON lines read through a server-side cursor,
+    so memory use does not depend on the table size. With `since`, only
+    users modified after that cursor are exported, re-reading the last
+    USERS_EXPORT_OVERLAP seconds before it. updated_at comes from the app
+    server clock when the row is written, not when it commits, so rows may
+    show up after a cursor that is already past them; consumers must upsert
+    by id. Deleted users are not reported, so consumers still need a
+    periodic full export to drop them. The last line holds the cursor to
+    pass on the next run. Rows are
+    read inside a transaction that stays open until the generator is
+    exhausted or closed. Raises InvalidCursor before anything is streamed.
+    """
+    queryset = CustomUser.objects.values(*EXPORT_FIELDS)
+    if since:
+        updated_at, _ = decode_cursor(since)
+        overlap = timedelta(seconds=settings.USERS_EXPORT_OVERLAP)
+        try:
+            start = updated_at - overlap
+        except OverflowError as exc:
+            raise InvalidCursor("Cursor inválido.") from exc
+        queryset = queryset.filter(updated_at__gte=start).order_by(
+            "updated_at", "pk"
+        )
+    else:
+        queryset = queryset.order_by("pk")
+    return _stream(queryset.iterator(chunk_size=CHUNK_SIZE), since)
+
+
+def _stream(
+    users: Iterator[dict[str, Any]], since: str | None
+) -> Generator[str, None, None]:
+    last: tuple[datetime, int] | None = None
+    # The query only runs on the first read. Outside a transaction the
+    # server-side cursor is declared WITH HOLD, and Postgres would copy the
+    # whole result set before the first row is sent.
+    with transaction.atomic(savepoint=False):
+        for user in users:
+            if user["updated_at"] is not None:
+                position = (user["updated_at"], user["id"])
+                last = position if last is None else max(last, position)
+            yield _dumps(user)
+
+    yield _dumps({"cursor": encode_cursor(*last) if last else since})
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    return json.dumps(data, cls=DjangoJSONEncoder) + "\n"
@@ -0,0 +1,163 @@
+import hashlib
+import time
+import uuid
+from datetime import timedelta
+from functools import wraps
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.users.models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+POLL_INTERVAL = 0.05
+
+ViewMethod = Callable[..., Response]
+
+
+def _digest(request: Request, key: str) -> str:
+    return hashlib.sha256(f"{request.path}:{key}".encode()).hexdigest()
+
+
+def _fingerprint(request: Request) -> str:
+    return hashlib.sha256(request.body).hexdigest()
+
+
+def _replay(record: IdempotencyKey, fingerprint: str) -> Response:
+    if record.fingerprint != fingerprint:
+        return Response(
+            {
+                "detail": (
+                    "Idempotency-Key já utilizada com um corpo de "
+                    "requisição diferente."
+                )
+            },
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    response = Response(record.data, status=record.status)
+    response[REPLAYED_HEADER] = "true"
+    return response
+
+
+def _acquire_lock(digest: str, fingerprint: str) -> str | None:
+    """
+    Inserts the record for `digest` and returns its lock token, or None
+    when another request holds the lock or has already stored a response.
+    Expired records and locks abandoned past IDEMPOTENCY_LOCK_TIMEOUT are
+    taken over.
+    """
+    now = timezone.now()
+    lock_token = uuid.uuid4().hex
+    values: dict[str, Any] = {
+        "fingerprint": fingerprint,
+        "lock_token": lock_token,
+        "locked_until": now
+        + timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT),
+        "status": None,
+        "data": None,
+        "expires": now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+    }
+    try:
+        with transaction.atomic():
+            IdempotencyKey.objects.create(key=digest, **values)
+    except IntegrityError:
+        taken = (
+            IdempotencyKey.objects.filter(key=digest)
+            .filter(
+                Q(expires__lte=now)
+                | Q(status__isnull=True, locked_until__lte=now)
+            )
+            .update(**values)
+        )
+        if not taken:
+            return None
+    return lock_token
+
+
+def _wait_for_response(digest: str) -> IdempotencyKey | None:
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        record = IdempotencyKey.objects.filter(key=digest).first()
+        if record is None or record.status is not None:
+            return record
+        time.sleep(POLL_INTERVAL)
+    return None
+
+
+def idempotent(view_method: ViewMethod) -> ViewMethod:
+    """
+    Makes an APIView handler honour the Idempotency-Key header. The first
+    response for a key is stored for IDEMPOTENCY_KEY_TTL seconds and replayed
+    for retries, while concurrent duplicates wait for the in-flight request
+    instead of executing the handler again.
+    """
+
+    @wraps(view_method)
+    def wrapper(
+        self: Any, request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"detail": "Idempotency-Key inválida."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        digest = _digest(request, key)
+        fingerprint = _fingerprint(request)
+
+        record = IdempotencyKey.objects.filter(
+            key=digest, status__isnull=False, expires__gt=timezone.now()
+        ).first()
+        if record is not None:
+            return _replay(record, fingerprint)
+
+        lock_token = _acquire_lock(digest, fingerprint)
+        if lock_token is None:
+            record = _wait_for_response(digest)
+            if record is not None:
+                return _replay(record, fingerprint)
+            return Response(
+                {
+                    "detail": (
+                        "Uma requisição com esta Idempotency-Key ainda está "
+                        "em processamento."
+                    )
+                },
+                status=status.HTTP_409_CONFLICT,
+                headers={"Retry-After": "1"},
+            )
+
+        # The lock may have expired and been taken by a duplicate, in which
+        # case the record is no longer ours to update
+        locked = IdempotencyKey.objects.filter(
+            key=digest, lock_token=lock_token
+        )
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except BaseException:
+            locked.delete()
+            raise
+        if response.status_code < 500:
+            locked.update(
+                status=response.status_code,
+                data=response.data,
+                lock_token=None,
+                locked_until=None,
+            )
+        else:
+            locked.delete()
+        return response
+
+    return wrapper
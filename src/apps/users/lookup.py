@@ -0,0 +1,61 @@
+import hashlib
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+
+from apps.users.models import CustomUser
+
+from .serializers import UserSerializer
+
+ID_CACHE_KEY = "users:lookup:id:{}"
+EMAIL_CACHE_KEY = "users:lookup:email:{}"
+
+
+def _email_cache_key(email: str) -> str:
+    return EMAIL_CACHE_KEY.format(hashlib.sha256(email.encode()).hexdigest())
+
+
+def lookup_users(
+    ids: list[int], emails: list[str]
+) -> tuple[dict[int, Any], dict[str, Any]]:
+    """
+    Resolves ids and emails to serialized users. Recently resolved users are
+    served from a short-lived per-worker cache and the rest are fetched with
+    a single IN query. Keys without a matching user are left out of the
+    result.
+    """
+    cache = caches[settings.USERS_LOOKUP_CACHE]
+    id_keys = {ID_CACHE_KEY.format(pk): pk for pk in ids}
+    email_keys = {_email_cache_key(email): email for email in emails}
+    cached = cache.get_many([*id_keys, *email_keys])
+
+    by_id = {
+        id_keys[key]: data for key, data in cached.items() if key in id_keys
+    }
+    by_email = {
+        email_keys[key]: data
+        for key, data in cached.items()
+        if key in email_keys
+    }
+
+    missing_ids = {pk for pk in ids if pk not in by_id}
+    missing_emails = {email for email in emails if email not in by_email}
+    if not missing_ids and not missing_emails:
+        return by_id, by_email
+
+    users = CustomUser.objects.filter(
+        Q(pk__in=missing_ids) | Q(email__in=missing_emails)
+    )
+    fetched: dict[str, Any] = {}
+    for data in UserSerializer(users, many=True).data:
+        if data["id"] in missing_ids:
+            by_id[data["id"]] = data
+        if data["email"] in missing_emails:
+            by_email[data["email"]] = data
+        fetched[ID_CACHE_KEY.format(data["id"])] = data
+        fetched[_email_cache_key(data["email"])] = data
+
+    cache.set_many(fetched, timeout=settings.USERS_LOOKUP_CACHE_TTL)
+    return by_id, by_email
@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.users.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes expired Idempotency-Key records. Meant to run "
+        "periodically, like clearsessions"
+    )
+
+    def handle(self, *args: Any, **options: Any):
+        deleted, _ = IdempotencyKey.objects.filter(
+            expires__lte=timezone.now()
+        ).delete()
+        self.stdout.write(f"Deleted {deleted} expired records")
@@ -0,0 +1,49 @@
+import gzip
+import sys
+from typing import Any, TextIO
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from apps.users.export import InvalidCursor, export_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports users as NDJSON. The last line holds the cursor to pass "
+        "as --since on the next run to export only the changes. Deleted "
+        "users are not reported, run a full export periodically to drop "
+        "them"
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("--since", help="Cursor of a previous export")
+        parser.add_argument(
+            "--output", help="File to write to, defaults to stdout"
+        )
+        parser.add_argument(
+            "--gzip", action="store_true", help="Compress the output"
+        )
+
+    def handle(self, *args: Any, **options: Any):
+        try:
+            lines = export_users(options["since"])
+        except InvalidCursor as exc:
+            raise CommandError(exc) from exc
+
+        if options["gzip"]:
+            output: TextIO = gzip.open(
+                options["output"] or sys.stdout.buffer, "wt"
+            )
+        elif options["output"]:
+            output = open(options["output"], "w")
+        else:
+            for line in lines:
+                self.stdout.write(line)
+            return
+
+        with output:
+            output.writelines(lines)
@@ -2,15 +2,30 @@ from typing import Any
 
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractBaseUser
+from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
+class CustomUserQuerySet(models.QuerySet[AbstractBaseUser]):
+    def update(self, **kwargs: Any) -> int:
+        """
+        Bumps updated_at like save() does, so bulk updates are picked up by
+        the incremental export. An explicit updated_at is kept.
+        """
+        kwargs.setdefault("updated_at", timezone.now())
+        return super().update(**kwargs)
+
+
 class CustomUserManager(BaseUserManager[AbstractBaseUser]):
     """
     Custom user model where email is the unique identifier
     for authentication instead of user name
     """
 
+    def get_queryset(self) -> CustomUserQuerySet:
+        return CustomUserQuerySet(self.model, using=self._db)
+
     def create_user(
         self,
         email: str,
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+from apps.zero_downtime.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='customuser',
+            index=models.Index(fields=['date_joined', 'id'], name='users_date_joined_id_idx'),
+        ),
+    ]
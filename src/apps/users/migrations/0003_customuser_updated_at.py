@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+from apps.zero_downtime.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0002_customuser_users_date_joined_id_idx'),
+    ]
+
+    # auto_now is only set in 0005, after the column is backfilled, so that
+    # existing rows are left null instead of being stamped with now()
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='updated_at',
+            field=models.DateTimeField(null=True),
+        ),
+        AddIndexConcurrently(
+            model_name='customuser',
+            index=models.Index(fields=['updated_at', 'id'], name='users_updated_at_id_idx'),
+        ),
+    ]
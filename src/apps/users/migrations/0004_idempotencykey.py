@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-19 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_customuser_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('lock_token', models.CharField(max_length=32, null=True)),
+                ('locked_until', models.DateTimeField(null=True)),
+                ('status', models.PositiveSmallIntegerField(null=True)),
+                ('data', models.JSONField(null=True)),
+                ('expires', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
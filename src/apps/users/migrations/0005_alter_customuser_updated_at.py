@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # auto_now only changes how Django fills the field, no SQL is emitted
+    zero_downtime_ignore = True
+
+    dependencies = [
+        ('users', '0004_idempotencykey'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customuser',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+    ]
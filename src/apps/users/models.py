@@ -1,4 +1,3 @@
-
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
 from django.utils import timezone
@@ -17,6 +16,7 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     profile_picture = models.ImageField(
         upload_to="profile_picture", blank=True, null=True
     )
+    updated_at = models.DateTimeField(auto_now=True, null=True)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
@@ -29,3 +29,29 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
+        indexes = [
+            models.Index(
+                fields=["date_joined", "id"],
+                name="users_date_joined_id_idx",
+            ),
+            models.Index(
+                fields=["updated_at", "id"],
+                name="users_updated_at_id_idx",
+            ),
+        ]
+
+
+class IdempotencyKey(models.Model):
+    """
+    Idempotency-Key record. While `status` is NULL the row is the lock of
+    the in-flight request holding `lock_token`, afterwards it holds the
+    response replayed for retries until `expires`.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    fingerprint = models.CharField(max_length=64)
+    lock_token = models.CharField(max_length=32, null=True)
+    locked_until = models.DateTimeField(null=True)
+    status = models.PositiveSmallIntegerField(null=True)
+    data = models.JSONField(null=True)
+    expires = models.DateTimeField(db_index=True)
@@ -0,0 +1,94 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.users.models import CustomUser
+
+
+class DateJoinedCursorPagination(BasePagination):
+    """
+    Keyset pagination on (date_joined, id). Each page is a range scan on the
+    matching index, so fetching a page costs the same however deep the
+    client pages.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 200
+    invalid_cursor_message = "Cursor inválido."
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet[CustomUser],
+        request: Request,
+        view: Any = None,
+    ) -> list[CustomUser]:
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            date_joined, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(date_joined__gte=date_joined).filter(
+                Q(date_joined__gt=date_joined) | Q(pk__gt=pk)
+            )
+
+        results = list(queryset.order_by("date_joined", "pk")[: page_size + 1])
+        self.has_next = len(results) > page_size
+        self.page = results[:page_size]
+        return self.page
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(
+        self, schema: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(
+                request.query_params.get(
+                    self.page_size_query_param, self.page_size
+                )
+            )
+        except ValueError:
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.page[-1])
+        )
+
+    def encode_cursor(self, user: CustomUser) -> str:
+        position = f"{user.date_joined.isoformat()}|{user.pk}"
+        return urlsafe_b64encode(position.encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> tuple[datetime, int]:
+        try:
+            date_joined, pk = (
+                urlsafe_b64decode(cursor.encode()).decode().split("|")
+            )
+            return datetime.fromisoformat(date_joined), int(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
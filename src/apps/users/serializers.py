@@ -62,3 +62,66 @@ class SignUpSerializer(serializers.ModelSerializer):
         )
 
         send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [user.email])
+
+
+class UserSerializer(serializers.ModelSerializer):
+    """
+    Read-only representation of a user. Accepts a `fields` argument to
+    build a sparse fieldset with only the requested fields.
+    """
+
+    class Meta:  # pyright: ignore
+        model = cast(CustomUser, get_user_model())
+        fields = [
+            "id",
+            "email",
+            "first_name",
+            "last_name",
+            "is_active",
+            "is_staff",
+            "date_joined",
+            "updated_at",
+            "profile_picture",
+        ]
+        read_only_fields = fields
+
+    def __init__(
+        self, *args: Any, fields: list[str] | None = None, **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+# Primary keys are bigint
+MAX_USER_ID = 2**63 - 1
+
+
+class UserBatchLookupSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=MAX_USER_ID),
+        required=False,
+    )
+    emails = serializers.ListField(
+        child=serializers.EmailField(), required=False
+    )
+
+    def validate(self, attrs: Any) -> Any:
+        ids = list(dict.fromkeys(attrs.get("ids", [])))
+        emails = list(
+            dict.fromkeys(
+                CustomUserManager.normalize_email(email)
+                for email in attrs.get("emails", [])
+            )
+        )
+        if not ids and not emails:
+            raise serializers.ValidationError(
+                "Informe ao menos um id ou email."
+            )
+        if len(ids) + len(emails) > settings.USERS_LOOKUP_MAX_KEYS:
+            raise serializers.ValidationError(
+                f"Informe no máximo {settings.USERS_LOOKUP_MAX_KEYS} "
+                f"ids e emails."
+            )
+        return {"ids": ids, "emails": emails}
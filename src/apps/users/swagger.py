@@ -3,13 +3,31 @@ from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiResponse,
     extend_schema,
+    inline_serializer,  # pyright: ignore[reportUnknownVariableType]
 )
+from rest_framework import serializers
 
-from .serializers import SignUpSerializer
+from .serializers import (
+    SignUpSerializer,
+    UserBatchLookupSerializer,
+    UserSerializer,
+)
 
 sign_up_schema = extend_schema(
     summary="User sign-up",
     request=SignUpSerializer(),
+    parameters=[
+        OpenApiParameter(
+            name="Idempotency-Key",
+            description=(
+                "Chave única por tentativa de cadastro. Repetições com a "
+                "mesma chave recebem a resposta original."
+            ),
+            location=OpenApiParameter.HEADER,
+            type=OpenApiTypes.STR,
+            required=False,
+        )
+    ],
     responses={
         204: OpenApiResponse(
             response=None,
@@ -21,6 +39,19 @@ sign_up_schema = extend_schema(
         400: OpenApiResponse(
             response=None, description="Dados inválidos para cadastro."
         ),
+        409: OpenApiResponse(
+            response=None,
+            description=(
+                "Requisição com a mesma Idempotency-Key ainda em "
+                "processamento."
+            ),
+        ),
+        422: OpenApiResponse(
+            response=None,
+            description=(
+                "Idempotency-Key já utilizada com um corpo diferente."
+            ),
+        ),
     },
     tags=["Authentication"],
 )
@@ -54,3 +85,117 @@ confirm_sign_up_schema = extend_schema(
     },
     tags=["Authentication"],
 )
+
+fields_parameter = OpenApiParameter(
+    name="fields",
+    description=(
+        "Lista de campos separados por vírgula a serem retornados, "
+        "ex.: id,email."
+    ),
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    required=False,
+)
+
+user_list_schema = extend_schema(
+    summary="List users",
+    parameters=[
+        OpenApiParameter(
+            name="cursor",
+            description="Cursor retornado no link `next` da página anterior.",
+            location=OpenApiParameter.QUERY,
+            type=OpenApiTypes.STR,
+            required=False,
+        ),
+        OpenApiParameter(
+            name="page_size",
+            description="Quantidade de usuários por página (máximo 200).",
+            location=OpenApiParameter.QUERY,
+            type=OpenApiTypes.INT,
+            required=False,
+        ),
+        fields_parameter,
+    ],
+    responses={
+        200: UserSerializer(many=True),
+        400: OpenApiResponse(
+            response=None, description="Campos inválidos em `fields`."
+        ),
+        404: OpenApiResponse(response=None, description="Cursor inválido."),
+    },
+    tags=["Users"],
+)
+
+user_detail_schema = extend_schema(
+    summary="Retrieve user",
+    parameters=[fields_parameter],
+    responses={
+        200: UserSerializer,
+        400: OpenApiResponse(
+            response=None, description="Campos inválidos em `fields`."
+        ),
+        404: OpenApiResponse(
+            response=None, description="Usuário não encontrado."
+        ),
+    },
+    tags=["Users"],
+)
+
+user_batch_lookup_schema = extend_schema(
+    summary="Batch user lookup",
+    request=UserBatchLookupSerializer(),
+    responses={
+        200: inline_serializer(
+            name="UserBatchLookupResponse",
+            fields={
+                "users": UserSerializer(many=True),
+                "missing": inline_serializer(
+                    name="UserBatchLookupMissing",
+                    fields={
+                        "ids": serializers.ListField(
+                            child=serializers.IntegerField()
+                        ),
+                        "emails": serializers.ListField(
+                            child=serializers.EmailField()
+                        ),
+                    },
+                ),
+            },
+        ),
+        400: OpenApiResponse(
+            response=None,
+            description="Nenhuma chave informada ou limite excedido.",
+        ),
+    },
+    tags=["Users"],
+)
+
+user_export_schema = extend_schema(
+    summary="Export users as NDJSON",
+    parameters=[
+        OpenApiParameter(
+            name="since",
+            description=(
+                "Cursor da última linha de uma exportação anterior. Quando "
+                "informado, apenas usuários alterados depois dele são "
+                "exportados."
+            ),
+            location=OpenApiParameter.QUERY,
+            type=OpenApiTypes.STR,
+            required=False,
+        )
+    ],
+    responses={
+        (200, "application/x-ndjson"): OpenApiResponse(
+            response=OpenApiTypes.STR,
+            description=(
+                "Um usuário por linha. A última linha contém o cursor "
+                "para a próxima exportação. Usuários removidos não são "
+                "informados, faça uma exportação completa periodicamente "
+                "para descartá-los."
+            ),
+        ),
+        400: OpenApiResponse(response=None, description="Cursor inválido."),
+    },
+    tags=["Users"],
+)
@@ -0,0 +1,60 @@
+import json
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.users.export import encode_cursor
+from apps.users.models import IdempotencyKey
+
+from .utils import create_user
+
+
+class ExportUsersCommandTests(TestCase):
+    def setUp(self):
+        self.user = create_user(email="user@example.com", first_name="user")
+
+    def export(self, *args: str) -> list[dict[str, str]]:
+        out = StringIO()
+        call_command("export_users", *args, stdout=out)
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_export_and_resume(self):
+        user, last = self.export()
+
+        self.assertEqual(user["email"], "user@example.com")
+        # Rows inside the overlap window are exported again
+        self.assertEqual(
+            self.export(f"--since={last['cursor']}"), [user, last]
+        )
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(CommandError):
+            call_command("export_users", "--since=invalid")
+
+    def test_overflowing_cursor(self):
+        cursor = encode_cursor(datetime.min, 1)
+
+        with self.assertRaises(CommandError):
+            call_command("export_users", f"--since={cursor}")
+
+
+class ClearIdempotencyKeysCommandTests(TestCase):
+    def test_deletes_expired_records(self):
+        now = timezone.now()
+        for key, expires in [
+            ("expired", now),
+            ("live", now + timedelta(days=1)),
+        ]:
+            IdempotencyKey.objects.create(
+                key=key, fingerprint="", expires=expires
+            )
+
+        call_command("clear_idempotency_keys", stdout=StringIO())
+
+        self.assertEqual(
+            list(IdempotencyKey.objects.values_list("key", flat=True)),
+            ["live"],
+        )
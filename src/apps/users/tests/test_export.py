@@ -0,0 +1,22 @@
+from django.db import connection
+from django.test import TransactionTestCase
+
+from apps.users.export import export_users
+
+from .utils import create_user
+
+
+class ExportUsersTests(TransactionTestCase):
+    def setUp(self):
+        create_user(email="user@example.com", first_name="user")
+
+    def test_cursor_is_not_held_past_the_transaction(self):
+        lines = export_users()
+        next(lines)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT is_holdable FROM pg_cursors")
+            self.assertEqual(cursor.fetchall(), [(False,)])
+
+        lines.close()
+        self.assertFalse(connection.in_atomic_block)
@@ -0,0 +1,109 @@
+from unittest.mock import MagicMock, patch
+
+import jwt
+from django.conf import settings
+from django.core.cache import caches
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+
+from apps.query_budget.budget import query_budget
+from apps.users.idempotency import IDEMPOTENCY_HEADER, REPLAYED_HEADER
+from apps.users.models import CustomUser
+
+from .utils import StaffAPITestCase, create_user
+
+
+class UsersQueryBudgetTests(StaffAPITestCase):
+    def setUp(self):
+        super().setUp()
+        caches[settings.USERS_LOOKUP_CACHE].clear()
+        for i in range(5):
+            create_user(email=f"user{i}@example.com", first_name=f"user{i}")
+
+    @patch("apps.users.serializers.send_mail")
+    def test_sign_up(self, _: MagicMock):
+        with query_budget("users:sign-up"):
+            response = self.client.post(
+                reverse("sign-up"),
+                {
+                    "email": "test@example.com",
+                    "first_name": "John",
+                    "password": "securepassword123",
+                },
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 204)
+
+    @patch("apps.users.serializers.send_mail")
+    def test_sign_up_idempotent(self, _: MagicMock):
+        def sign_up():
+            return self.client.post(
+                reverse("sign-up"),
+                {
+                    "email": "test@example.com",
+                    "first_name": "John",
+                    "password": "securepassword123",
+                },
+                content_type="application/json",
+                headers={IDEMPOTENCY_HEADER: "sign-up-key"},
+            )
+
+        with query_budget("users:sign-up-idempotent"):
+            self.assertEqual(sign_up().status_code, 204)
+            replayed = sign_up()
+            self.assertEqual(replayed.status_code, 204)
+
+        self.assertEqual(replayed.headers[REPLAYED_HEADER], "true")
+
+    def test_confirm_sign_up(self):
+        user = create_user(email="inactive@example.com", first_name="inactive")
+        token = jwt.encode(  # pyright: ignore
+            {"uid": user.pk}, settings.SECRET_KEY, algorithm="HS256"
+        )
+
+        with query_budget("users:confirm-sign-up"):
+            response = self.client.get(reverse("sign-up", args=[token]))
+            self.assertEqual(response.status_code, 204)
+
+        user.refresh_from_db()
+        self.assertTrue(user.is_active)
+
+    def test_user_list(self):
+        with query_budget("users:user-list"):
+            response = self.client.get(
+                reverse("user-list"), {"page_size": 2}, headers=self.headers
+            )
+            self.assertEqual(response.status_code, 200)
+            response = self.client.get(
+                response.json()["next"], headers=self.headers
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_user_detail(self):
+        with query_budget("users:user-detail"):
+            response = self.client.get(
+                reverse("user-detail", args=[self.staff.pk]),
+                headers=self.headers,
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_user_batch_lookup(self):
+        ids = list(CustomUser.objects.values_list("pk", flat=True))
+
+        with query_budget("users:user-batch-lookup"):
+            response = self.client.post(
+                reverse("user-batch-lookup"),
+                {"ids": ids, "emails": ["user1@example.com"]},
+                content_type="application/json",
+                headers=self.headers,
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_user_export(self):
+        with query_budget("users:user-export"):
+            response = self.client.get(
+                reverse("user-export"), headers=self.headers
+            )
+            self.assertEqual(response.status_code, 200)
+            assert isinstance(response, StreamingHttpResponse)
+            response.getvalue()
@@ -1,9 +1,27 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+from typing import Any
 from unittest.mock import ANY, MagicMock, patch
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import Client, TestCase
+from django.core.cache import caches
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+
+from apps.users.export import encode_cursor
+from apps.users.idempotency import (
+    _digest,  # pyright: ignore[reportPrivateUsage]
+    _fingerprint,  # pyright: ignore[reportPrivateUsage]
+)
+from apps.users.models import IdempotencyKey
+
+from .utils import StaffAPITestCase, create_user
 
 User = get_user_model()
 
@@ -69,3 +87,429 @@ class SignUpViewTests(TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertIn("password", response.json())
         send_mail.assert_not_called()
+
+
+class SignUpIdempotencyTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.url = reverse("sign-up")
+        self.data = {
+            "email": "test@example.com",
+            "first_name": "John",
+            "last_name": "Doe",
+            "password": "securepassword123",
+        }
+        self.digest = _digest(MagicMock(path=self.url), "abc")
+        self.fingerprint = _fingerprint(
+            MagicMock(body=json.dumps(self.data).encode())
+        )
+
+    def sign_up(self, data: dict[str, str] | None = None):
+        return self.client.post(
+            self.url,
+            data or self.data,
+            content_type="application/json",
+            headers={"Idempotency-Key": "abc"},
+        )
+
+    def create_record(self, **fields: Any) -> IdempotencyKey:
+        now = timezone.now()
+        return IdempotencyKey.objects.create(
+            **{
+                "key": self.digest,
+                "fingerprint": self.fingerprint,
+                "lock_token": "in-flight",
+                "locked_until": now + timedelta(hours=1),
+                "expires": now + timedelta(days=1),
+                **fields,
+            }
+        )
+
+    @patch("apps.users.serializers.send_mail")
+    def test_retry_replays_stored_response(self, send_mail: MagicMock):
+        responses = [self.sign_up() for _ in range(2)]
+
+        self.assertEqual([r.status_code for r in responses], [204, 204])
+        self.assertEqual(responses[1]["Idempotent-Replayed"], "true")
+        self.assertEqual(
+            User.objects.filter(email="test@example.com").count(), 1
+        )
+        send_mail.assert_called_once()
+
+    @patch("apps.users.serializers.send_mail")
+    def test_key_reused_with_different_body(self, send_mail: MagicMock):
+        self.sign_up()
+        data = self.data.copy()
+        data["email"] = "other@example.com"
+        response = self.sign_up(data)
+
+        self.assertEqual(response.status_code, 422)
+        self.assertFalse(User.objects.filter(email=data["email"]).exists())
+
+    @patch("apps.users.serializers.send_mail")
+    def test_concurrent_duplicate_waits_for_response(
+        self, send_mail: MagicMock
+    ):
+        record = self.create_record()
+
+        def finish_in_flight_request(_: float):
+            IdempotencyKey.objects.filter(pk=record.pk).update(
+                status=204, lock_token=None, locked_until=None
+            )
+
+        with patch(
+            "apps.users.idempotency.time.sleep",
+            side_effect=finish_in_flight_request,
+        ) as sleep:
+            response = self.sign_up()
+
+        sleep.assert_called_once()
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response["Idempotent-Replayed"], "true")
+        self.assertFalse(
+            User.objects.filter(email="test@example.com").exists()
+        )
+        send_mail.assert_not_called()
+
+    @patch("apps.users.serializers.send_mail")
+    def test_lock_taken_by_another_request_is_kept(self, send_mail: MagicMock):
+        def take_over_lock(*args: Any):
+            IdempotencyKey.objects.filter(key=self.digest).update(
+                lock_token="other-request"
+            )
+
+        send_mail.side_effect = take_over_lock
+        self.sign_up()
+
+        record = IdempotencyKey.objects.get(key=self.digest)
+        self.assertEqual(record.lock_token, "other-request")
+        self.assertIsNone(record.status)
+
+    @override_settings(IDEMPOTENCY_WAIT_TIMEOUT=0)
+    @patch("apps.users.serializers.send_mail")
+    def test_in_flight_duplicate_conflict(self, send_mail: MagicMock):
+        self.create_record()
+
+        response = self.sign_up()
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn("Retry-After", response)
+        send_mail.assert_not_called()
+
+    @patch("apps.users.serializers.send_mail")
+    def test_abandoned_lock_is_taken_over(self, send_mail: MagicMock):
+        self.create_record(locked_until=timezone.now())
+
+        response = self.sign_up()
+
+        self.assertEqual(response.status_code, 204)
+        self.assertNotIn("Idempotent-Replayed", response)
+        send_mail.assert_called_once()
+
+    @patch("apps.users.serializers.send_mail")
+    def test_expired_response_is_not_replayed(self, send_mail: MagicMock):
+        self.create_record(status=200, lock_token=None, expires=timezone.now())
+
+        response = self.sign_up()
+
+        self.assertEqual(response.status_code, 204)
+        send_mail.assert_called_once()
+        self.assertEqual(IdempotencyKey.objects.get().status, 204)
+
+    @patch("apps.users.serializers.send_mail")
+    def test_failed_request_releases_key(self, send_mail: MagicMock):
+        send_mail.side_effect = RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            self.sign_up()
+
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+
+class UserListViewTests(StaffAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("user-list")
+        self.users = [self.staff] + [
+            create_user(email=f"user{i}@example.com", first_name=f"user{i}")
+            for i in range(4)
+        ]
+
+    def test_requires_staff(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_cursor_pagination(self):
+        emails: list[str] = []
+        url: str | None = f"{self.url}?page_size=2"
+        while url:
+            response = self.client.get(url, headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+            emails += [user["email"] for user in response.json()["results"]]
+            url = response.json()["next"]
+
+        self.assertEqual(emails, [user.email for user in self.users])
+
+    def test_cursor_pagination_with_equal_date_joined(self):
+        User.objects.update(date_joined=self.staff.date_joined)
+
+        first = self.client.get(
+            self.url, {"page_size": 3}, headers=self.headers
+        ).json()
+        second = self.client.get(first["next"], headers=self.headers).json()
+
+        ids = [user["id"] for user in first["results"] + second["results"]]
+        self.assertEqual(ids, sorted(user.pk for user in self.users))
+        self.assertIsNone(second["next"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            self.url, {"cursor": "invalid"}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_sparse_fieldset(self):
+        response = self.client.get(
+            self.url, {"fields": "id,email"}, headers=self.headers
+        )
+
+        self.assertEqual(
+            set(response.json()["results"][0].keys()), {"id", "email"}
+        )
+
+    def test_unknown_field(self):
+        response = self.client.get(
+            self.url, {"fields": "id,password"}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.json())
+
+    def test_fields_with_blanks(self):
+        response = self.client.get(
+            self.url, {"fields": " id, ,email, "}, headers=self.headers
+        )
+
+        self.assertEqual(
+            set(response.json()["results"][0].keys()), {"id", "email"}
+        )
+
+    def test_empty_fields(self):
+        for fields in [",", " , "]:
+            response = self.client.get(
+                self.url, {"fields": fields}, headers=self.headers
+            )
+
+            self.assertEqual(response.status_code, 400)
+
+    def test_conditional_request(self):
+        response = self.client.get(self.url, headers=self.headers)
+        etag = response["ETag"]
+
+        response = self.client.get(
+            self.url, headers={**self.headers, "If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+
+class UserDetailViewTests(StaffAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("user-detail", args=[self.staff.pk])
+
+    def test_retrieve_user(self):
+        response = self.client.get(self.url, headers=self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["email"], "staff@example.com")
+        self.assertIn("Authorization", response["Vary"])
+
+    def test_sparse_fieldset(self):
+        response = self.client.get(
+            self.url, {"fields": "first_name"}, headers=self.headers
+        )
+
+        self.assertEqual(response.json(), {"first_name": "staff"})
+
+    def test_user_not_found(self):
+        response = self.client.get(
+            reverse("user-detail", args=[0]), headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class UserBatchLookupViewTests(StaffAPITestCase):
+    def setUp(self):
+        super().setUp()
+        caches[settings.USERS_LOOKUP_CACHE].clear()
+        self.url = reverse("user-batch-lookup")
+        self.user = create_user(email="user@example.com", first_name="user")
+
+    def lookup(self, data: dict[str, list[int | str]]):
+        return self.client.post(
+            self.url,
+            data,
+            content_type="application/json",
+            headers=self.headers,
+        )
+
+    def test_resolves_ids_and_emails_in_one_query(self):
+        data: dict[str, list[int | str]] = {
+            "ids": [self.staff.pk, self.staff.pk, self.user.pk + 1],
+            "emails": ["user@example.com", "missing@example.com"],
+        }
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.lookup(data)
+
+        # Token authentication and the users query, cache writes are free
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(
+            sorted(user["email"] for user in body["users"]),
+            ["staff@example.com", "user@example.com"],
+        )
+        self.assertEqual(
+            body["missing"],
+            {"ids": [self.user.pk + 1], "emails": ["missing@example.com"]},
+        )
+
+    def test_repeated_lookups_are_cached(self):
+        data: dict[str, list[int | str]] = {
+            "ids": [self.user.pk],
+            "emails": ["staff@example.com"],
+        }
+        self.lookup(data)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.lookup(data)
+
+        # Only token authentication
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(len(response.json()["users"]), 2)
+
+    def test_emails_are_normalized(self):
+        create_user(email="U1@example.com", first_name="u1")
+
+        response = self.lookup({"emails": ["U1@Example.com"]})
+
+        self.assertEqual(response.json()["missing"]["emails"], [])
+        self.assertEqual(
+            [user["email"] for user in response.json()["users"]],
+            ["U1@example.com"],
+        )
+
+    @override_settings(USERS_LOOKUP_MAX_KEYS=1)
+    def test_email_spellings_count_as_one_key(self):
+        response = self.lookup(
+            {"emails": ["user@example.com", "user@EXAMPLE.com"]}
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(USERS_LOOKUP_MAX_KEYS=2)
+    def test_too_many_keys(self):
+        response = self.lookup({"ids": [1, 2, 3]})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_id_out_of_range(self):
+        response = self.lookup({"ids": [2**63]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("ids", response.json())
+
+    def test_no_keys(self):
+        response = self.lookup({})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class UserExportViewTests(StaffAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("user-export")
+        self.user = create_user(email="user@example.com", first_name="user")
+
+    def export(self, **params: str) -> list[dict[str, Any]]:
+        response = self.client.get(self.url, params, headers=self.headers)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        assert isinstance(response, StreamingHttpResponse)
+        content = response.getvalue().decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_full_export(self):
+        *users, last = self.export()
+
+        self.assertEqual(
+            [user["email"] for user in users],
+            ["staff@example.com", "user@example.com"],
+        )
+        self.assertIn("cursor", last)
+
+    def age_users(self):
+        now = timezone.now()
+        User.objects.filter(pk=self.staff.pk).update(
+            updated_at=now - timedelta(hours=2)
+        )
+        User.objects.filter(pk=self.user.pk).update(
+            updated_at=now - timedelta(hours=1)
+        )
+
+    def test_incremental_export(self):
+        self.age_users()
+        *_, last = self.export()
+        self.staff.first_name = "changed"
+        self.staff.save()
+
+        *users, next_last = self.export(since=last["cursor"])
+
+        self.assertEqual(
+            [user["first_name"] for user in users], ["user", "changed"]
+        )
+        self.assertNotEqual(next_last["cursor"], last["cursor"])
+
+    def test_incremental_export_includes_queryset_updates(self):
+        self.age_users()
+        *_, last = self.export()
+
+        User.objects.filter(pk=self.staff.pk).update(first_name="changed")
+
+        *users, _ = self.export(since=last["cursor"])
+        self.assertIn("changed", [user["first_name"] for user in users])
+
+    def test_incremental_export_rereads_overlap(self):
+        self.age_users()
+        *_, last = self.export()
+
+        # Committed after the cursor was taken but stamped just before it
+        User.objects.filter(pk=self.staff.pk).update(
+            first_name="late",
+            updated_at=timezone.now() - timedelta(hours=1, minutes=1),
+        )
+
+        *users, _ = self.export(since=last["cursor"])
+        self.assertIn("late", [user["first_name"] for user in users])
+
+    def test_gzip(self):
+        response = self.client.get(
+            self.url, headers={**self.headers, "Accept-Encoding": "gzip"}
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        assert isinstance(response, StreamingHttpResponse)
+        content = gzip.decompress(response.getvalue())
+        self.assertEqual(len(content.decode().splitlines()), 3)
+
+    def test_invalid_cursor(self):
+        for cursor in ["invalid", encode_cursor(datetime.min, 1)]:
+            response = self.client.get(
+                self.url, {"since": cursor}, headers=self.headers
+            )
+
+            self.assertEqual(response.status_code, 400)
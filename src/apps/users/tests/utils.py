@@ -0,0 +1,51 @@
+from typing import Any, cast
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.authtoken.models import Token
+
+from apps.users.managers import CustomUserManager
+from apps.users.models import CustomUser
+
+
+def get_user_manager() -> CustomUserManager:
+    return cast(CustomUserManager, get_user_model().objects)
+
+
+def create_user(
+    email: str, first_name: str, **extra_fields: Any
+) -> CustomUser:
+    return cast(
+        CustomUser,
+        get_user_manager().create_user(
+            email=email,
+            first_name=first_name,
+            last_name=None,
+            password="foo",
+            **extra_fields,
+        ),
+    )
+
+
+def create_staff_user() -> CustomUser:
+    return cast(
+        CustomUser,
+        get_user_manager().create_superuser(
+            email="staff@example.com",
+            first_name="staff",
+            last_name=None,
+            password="foo",
+        ),
+    )
+
+
+class StaffAPITestCase(TestCase):
+    """
+    Creates a staff user with an API token. Pass `self.headers` to the test
+    client to authenticate as them.
+    """
+
+    def setUp(self):
+        self.staff = create_staff_user()
+        token = Token.objects.create(user=self.staff)
+        self.headers = {"Authorization": f"Token {token.key}"}
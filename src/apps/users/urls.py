@@ -1,8 +1,19 @@
 from django.urls import path
 
-from .views import ConfirmSignUpView, SignUpView
+from .views import (
+    ConfirmSignUpView,
+    SignUpView,
+    UserBatchLookupView,
+    UserDetailView,
+    UserExportView,
+    UserListView,
+)
 
 urlpatterns = [
+    path("", UserListView.as_view(), name="user-list"),
+    path("<int:pk>", UserDetailView.as_view(), name="user-detail"),
+    path("batch", UserBatchLookupView.as_view(), name="user-batch-lookup"),
+    path("export", UserExportView.as_view(), name="user-export"),
     path("sign-up", SignUpView.as_view(), name="sign-up"),
     path(
         "confirm-sign-up/<str:token>",
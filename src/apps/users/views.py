@@ -1,19 +1,40 @@
 import jwt
 from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.text import compress_sequence
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.users.models import CustomUser
 
-from .serializers import SignUpSerializer
-from .swagger import confirm_sign_up_schema, sign_up_schema
+from .export import InvalidCursor, export_users
+from .idempotency import idempotent
+from .lookup import lookup_users
+from .pagination import DateJoinedCursorPagination
+from .serializers import (
+    SignUpSerializer,
+    UserBatchLookupSerializer,
+    UserSerializer,
+)
+from .swagger import (
+    confirm_sign_up_schema,
+    sign_up_schema,
+    user_batch_lookup_schema,
+    user_detail_schema,
+    user_export_schema,
+    user_list_schema,
+)
 
 
 class SignUpView(APIView):
     @sign_up_schema
+    @idempotent
     def post(self, request: Request):
         """
         Creates a new user account with the provided information. After
@@ -59,3 +80,140 @@ class ConfirmSignUpView(APIView):
         return Response(
             status=status.HTTP_204_NO_CONTENT,
         )
+
+
+def get_sparse_fields(request: Request) -> list[str] | None:
+    """
+    Parses the `fields` query parameter into a list of UserSerializer
+    fields, or None when every field was requested
+    """
+    fields = request.query_params.get("fields")
+    if not fields:
+        return None
+
+    requested = [field.strip() for field in fields.split(",")]
+    requested = [field for field in requested if field]
+    if not requested:
+        raise ValidationError({"fields": ["Informe ao menos um campo."]})
+
+    unknown = set(requested) - set(UserSerializer.Meta.fields)
+    if unknown:
+        raise ValidationError(
+            {"fields": [f"Campos inválidos: {', '.join(sorted(unknown))}."]}
+        )
+    return requested
+
+
+def cacheable(response: Response) -> Response:
+    """
+    Lets clients and proxies keep the response, revalidating it with the
+    ETag added by ConditionalGetMiddleware
+    """
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ("Authorization",))
+    return response
+
+
+class UserListView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @user_list_schema
+    def get(self, request: Request):
+        """
+        Lists users ordered by date joined. Use the `next` link to fetch the
+        following page and `fields` to select which fields are returned.
+        """
+        fields = get_sparse_fields(request)
+        queryset = CustomUser.objects.all()
+        if fields is not None:
+            queryset = queryset.only("id", "date_joined", *fields)
+
+        paginator = DateJoinedCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = UserSerializer(page, many=True, fields=fields)
+        return cacheable(paginator.get_paginated_response(serializer.data))
+
+
+class UserDetailView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @user_detail_schema
+    def get(self, request: Request, pk: int):
+        """
+        Returns the profile of a single user. Use `fields` to select which
+        fields are returned.
+        """
+        fields = get_sparse_fields(request)
+        queryset = CustomUser.objects.all()
+        if fields is not None:
+            queryset = queryset.only("id", *fields)
+
+        user = get_object_or_404(queryset, pk=pk)
+        serializer = UserSerializer(user, fields=fields)
+        return cacheable(Response(serializer.data))
+
+
+class UserBatchLookupView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @user_batch_lookup_schema
+    def post(self, request: Request):
+        """
+        Resolves a batch of user ids and emails to profiles with a single
+        query. Duplicated keys are ignored and keys without a matching user
+        are listed under `missing`.
+        """
+        serializer = UserBatchLookupSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        emails = serializer.validated_data["emails"]
+
+        by_id, by_email = lookup_users(ids, emails)
+        users = {
+            user["id"]: user for user in [*by_id.values(), *by_email.values()]
+        }
+        return Response(
+            {
+                "users": list(users.values()),
+                "missing": {
+                    "ids": [pk for pk in ids if pk not in by_id],
+                    "emails": [
+                        email for email in emails if email not in by_email
+                    ],
+                },
+            }
+        )
+
+
+class UserExportView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @user_export_schema
+    def get(self, request: Request):
+        """
+        Streams users as NDJSON. Pass the cursor from the last line of a
+        previous export as `since` to receive only users modified after it.
+        Deleted users are not reported, so a full export is still needed
+        periodically to drop them. The stream is gzipped when the client
+        accepts it.
+        """
+        try:
+            lines = export_users(request.query_params.get("since"))
+        except InvalidCursor as exc:
+            return Response(
+                {"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        content = (line.encode() for line in lines)
+        gzipped = "gzip" in request.headers.get("Accept-Encoding", "")
+        if gzipped:
+            content = compress_sequence(content)
+
+        response = StreamingHttpResponse(
+            content, content_type="application/x-ndjson"
+        )
+        if gzipped:
+            response["Content-Encoding"] = "gzip"
+        patch_vary_headers(response, ("Accept-Encoding",))
+        patch_vary_headers(response, ("Authorization",))
+        return response
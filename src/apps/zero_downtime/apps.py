@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.core.checks import register
+
+
+class ZeroDowntimeConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.zero_downtime"
+
+    def ready(self):
+        from .checks import check_hot_table_migrations
+
+        register(check_hot_table_migrations, "migrations")
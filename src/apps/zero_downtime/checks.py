@@ -0,0 +1,139 @@
+from typing import Any
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.core.checks import CheckMessage
+from django.core.checks import Warning as CheckWarning
+from django.db.migrations import Migration
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.operations import (
+    AddConstraint,
+    AddField,
+    AddIndex,
+    AlterField,
+    RemoveIndex,
+)
+from django.db.migrations.operations.base import Operation
+
+from .operations import RemoveIndexConcurrently, SetNotNull
+
+NON_ATOMIC_OPERATIONS = (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+    SetNotNull,
+)
+
+
+def _lock_warning(
+    migration: Migration, operation: Operation, hint: str, id: str
+) -> CheckWarning:
+    return CheckWarning(
+        f"{migration.app_label}.{migration.name}: "
+        f"'{operation.describe()}' takes a heavy lock on a hot table.",
+        hint=hint,
+        obj=migration,
+        id=id,
+    )
+
+
+def check_migration(
+    migration: Migration, hot_models: set[str]
+) -> list[CheckMessage]:
+    """
+    Flags operations that would block writes on the models listed in
+    ZERO_DOWNTIME_HOT_MODELS. Migrations that take such a lock on purpose
+    can set `zero_downtime_ignore = True` to be skipped.
+    """
+    messages: list[CheckMessage] = []
+    if getattr(migration, "zero_downtime_ignore", False):
+        return messages
+    for operation in migration.operations:
+        model_name = getattr(operation, "model_name", None)
+        if model_name is None:
+            continue
+        if f"{migration.app_label}.{model_name}".lower() not in hot_models:
+            continue
+
+        if isinstance(operation, NON_ATOMIC_OPERATIONS):
+            if migration.atomic:
+                messages.append(
+                    _lock_warning(
+                        migration,
+                        operation,
+                        "Set atomic = False on the migration so the lock "
+                        "is not held until the transaction commits.",
+                        "zero_downtime.W005",
+                    )
+                )
+        elif isinstance(operation, (AddIndex, RemoveIndex)):
+            messages.append(
+                _lock_warning(
+                    migration,
+                    operation,
+                    "Use AddIndexConcurrently/RemoveIndexConcurrently from "
+                    "apps.zero_downtime.operations in a non-atomic migration.",
+                    "zero_downtime.W001",
+                )
+            )
+        elif isinstance(operation, AddField):
+            field: Any = operation.field
+            if field.db_index or field.unique:
+                messages.append(
+                    _lock_warning(
+                        migration,
+                        operation,
+                        "Add the column without an index, then create it "
+                        "with AddIndexConcurrently.",
+                        "zero_downtime.W001",
+                    )
+                )
+            if not field.null:
+                messages.append(
+                    _lock_warning(
+                        migration,
+                        operation,
+                        "Add the column as null=True, fill it with the "
+                        "backfill command, then apply SetNotNull.",
+                        "zero_downtime.W002",
+                    )
+                )
+        elif isinstance(operation, AlterField):
+            messages.append(
+                _lock_warning(
+                    migration,
+                    operation,
+                    "AlterField may rewrite the table. Prefer a staged "
+                    "change or SetNotNull for nullability changes.",
+                    "zero_downtime.W003",
+                )
+            )
+        elif isinstance(operation, AddConstraint):
+            messages.append(
+                _lock_warning(
+                    migration,
+                    operation,
+                    "Create a unique index concurrently first, or add the "
+                    "constraint as NOT VALID and validate it separately.",
+                    "zero_downtime.W004",
+                )
+            )
+    return messages
+
+
+def check_hot_table_migrations(
+    app_configs: Any = None, **kwargs: Any
+) -> list[CheckMessage]:
+    hot_models = {model.lower() for model in settings.ZERO_DOWNTIME_HOT_MODELS}
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    app_labels = (
+        {app_config.label for app_config in app_configs}
+        if app_configs
+        else None
+    )
+
+    messages: list[CheckMessage] = []
+    for (app_label, _), migration in sorted(loader.disk_migrations.items()):
+        if app_labels is not None and app_label not in app_labels:
+            continue
+        messages.extend(check_migration(migration, hot_models))
+    return messages
@@ -0,0 +1,87 @@
+import json
+import time
+from typing import Any
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db.models import F
+
+
+class Command(BaseCommand):
+    help = (
+        "Fills a column in throttled batches keyed on id. Only rows where "
+        "the column is NULL are touched, so the command can be interrupted "
+        "and resumed with --start-id"
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("model", help="Model label, e.g. users.CustomUser")
+        parser.add_argument("field", help="Name of the column to fill")
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument("--value", help="JSON encoded value to write")
+        source.add_argument(
+            "--from-field", help="Copy the value of another column"
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.1,
+            help="Seconds to wait between batches",
+        )
+        parser.add_argument(
+            "--start-id",
+            type=int,
+            default=0,
+            help="Resume after this id",
+        )
+
+    def handle(self, *args: Any, **options: Any):
+        try:
+            model = apps.get_model(options["model"])
+            model._meta.get_field(options["field"])
+            if options["from_field"]:
+                model._meta.get_field(options["from_field"])
+        except (LookupError, ValueError, FieldDoesNotExist) as exc:
+            raise CommandError(exc) from exc
+
+        if options["from_field"]:
+            value = F(options["from_field"])
+        else:
+            try:
+                value = json.loads(options["value"])
+            except json.JSONDecodeError as exc:
+                raise CommandError(f"Invalid JSON value: {exc}") from exc
+
+        field = options["field"]
+        # Managers may bump auto_now fields on bulk updates, which would make
+        # every backfilled row look modified, e.g. to the incremental export
+        values = {
+            model_field.name: F(model_field.name)
+            for model_field in model._meta.concrete_fields
+            if getattr(model_field, "auto_now", False)
+        }
+        values[field] = value
+        pending = model._default_manager.filter(**{f"{field}__isnull": True})
+        last_id = options["start_id"]
+        total = 0
+        while True:
+            ids = list(
+                pending.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[: options["batch_size"]]
+            )
+            if not ids:
+                break
+
+            total += pending.filter(pk__in=ids).update(**values)
+            last_id = ids[-1]
+            self.stdout.write(f"Backfilled up to id {last_id} ({total} rows)")
+            time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Done, {total} rows backfilled"))
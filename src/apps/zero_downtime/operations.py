@@ -0,0 +1,130 @@
+from typing import Any, cast
+
+from django.contrib.postgres import operations as postgres_operations
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.operations.base import Operation
+from django.db.migrations.state import ProjectState
+
+# Missing from django-types
+RemoveIndexConcurrently = cast(
+    type[Operation],
+    postgres_operations.RemoveIndexConcurrently,  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+)
+
+__all__ = [
+    "AddIndexConcurrently",
+    "RemoveIndexConcurrently",
+    "SetNotNull",
+]
+
+
+class SetNotNull(Operation):
+    """
+    Last stage of a staged column addition: once a nullable column has been
+    backfilled, marks it NOT NULL without holding an ACCESS EXCLUSIVE lock
+    during the full table scan. On PostgreSQL the scan is done by validating
+    a NOT VALID check constraint, which lets SET NOT NULL skip it. Must be
+    used in a migration with atomic = False.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name: str, name: str):
+        self.model_name = model_name
+        self.name = name
+
+    @property
+    def model_name_lower(self) -> str:
+        return self.model_name.lower()
+
+    def deconstruct(self) -> tuple[str, list[Any], dict[str, Any]]:
+        return (
+            self.__class__.__name__,
+            [],
+            {"model_name": self.model_name, "name": self.name},
+        )
+
+    def state_forwards(self, app_label: str, state: ProjectState):
+        self._set_null(app_label, state, null=False)
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if schema_editor.connection.vendor != "postgresql":
+            self._alter_field(app_label, schema_editor, from_state, to_state)
+            return
+
+        table = model._meta.db_table
+        column = model._meta.get_field(self.name).column
+        constraint = cast(
+            str,
+            schema_editor._create_index_name(  # pyright: ignore
+                table, [column], suffix="_notnull"
+            ),
+        )
+        quote = schema_editor.quote_name
+        for statement in [
+            "ALTER TABLE {table} ADD CONSTRAINT {constraint} "
+            "CHECK ({column} IS NOT NULL) NOT VALID",
+            "ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}",
+            "ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL",
+            "ALTER TABLE {table} DROP CONSTRAINT {constraint}",
+        ]:
+            schema_editor.execute(
+                statement.format(
+                    table=quote(table),
+                    column=quote(column),
+                    constraint=quote(constraint),
+                )
+            )
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ):
+        self._alter_field(app_label, schema_editor, from_state, to_state)
+
+    def describe(self) -> str:
+        return f"Set {self.model_name}.{self.name} NOT NULL"
+
+    @property
+    def migration_name_fragment(self) -> str:
+        return f"{self.model_name_lower}_{self.name.lower()}_not_null"
+
+    def _set_null(self, app_label: str, state: ProjectState, null: bool):
+        model_state = state.models[app_label, self.model_name_lower]
+        field = model_state.fields[self.name].clone()
+        field.null = null
+        state.alter_field(  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+            app_label, self.model_name_lower, self.name, field, True
+        )
+
+    def _alter_field(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ):
+        from_model = from_state.apps.get_model(app_label, self.model_name)
+        to_model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(
+            schema_editor.connection.alias, to_model
+        ):
+            return
+        schema_editor.alter_field(
+            from_model,
+            from_model._meta.get_field(self.name),
+            to_model._meta.get_field(self.name),
+        )
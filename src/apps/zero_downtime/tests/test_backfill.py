@@ -0,0 +1,68 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.users.models import CustomUser
+from apps.users.tests.utils import create_user
+
+
+class BackfillCommandTests(TestCase):
+    def setUp(self):
+        self.users = [
+            create_user(email=f"user{i}@example.com", first_name=f"user{i}")
+            for i in range(5)
+        ]
+
+    def backfill(self, *args: str) -> str:
+        out = StringIO()
+        call_command(
+            "backfill",
+            "users.CustomUser",
+            "last_name",
+            *args,
+            "--sleep=0",
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_fills_null_rows_in_batches(self):
+        output = self.backfill('--value="Doe"', "--batch-size=2")
+
+        self.assertFalse(CustomUser.objects.filter(last_name=None).exists())
+        self.assertEqual(output.count("Backfilled up to id"), 3)
+        self.assertIn("5 rows backfilled", output)
+
+    def test_resumes_after_start_id(self):
+        self.backfill('--value="Doe"', f"--start-id={self.users[2].pk}")
+
+        self.assertEqual(CustomUser.objects.filter(last_name=None).count(), 3)
+
+    def test_does_not_overwrite_filled_rows(self):
+        CustomUser.objects.filter(pk=self.users[0].pk).update(
+            last_name="Moreira"
+        )
+
+        self.backfill("--from-field=first_name")
+
+        self.users[0].refresh_from_db()
+        self.users[1].refresh_from_db()
+        self.assertEqual(self.users[0].last_name, "Moreira")
+        self.assertEqual(self.users[1].last_name, "user1")
+
+    def test_keeps_updated_at(self):
+        updated_at = timezone.now() - timedelta(days=1)
+        CustomUser.objects.update(updated_at=updated_at)
+
+        self.backfill('--value="Doe"')
+
+        self.assertEqual(
+            set(CustomUser.objects.values_list("updated_at", flat=True)),
+            {updated_at},
+        )
+
+    def test_unknown_field(self):
+        with self.assertRaises(CommandError):
+            call_command("backfill", "users.CustomUser", "foo", "--value=1")
@@ -0,0 +1,100 @@
+from django.db import migrations, models
+from django.test import SimpleTestCase
+
+from apps.zero_downtime.checks import check_migration
+from apps.zero_downtime.operations import AddIndexConcurrently, SetNotNull
+
+HOT_MODELS = {"users.customuser"}
+
+
+def make_migration(
+    operations: list[migrations.operations.base.Operation],
+    atomic: bool = True,
+) -> migrations.Migration:
+    migration = migrations.Migration("0002_test", "users")
+    migration.operations = operations
+    migration.atomic = atomic
+    return migration
+
+
+class CheckMigrationTests(SimpleTestCase):
+    def assertCheckIds(
+        self, migration: migrations.Migration, expected: list[str]
+    ):
+        messages = check_migration(migration, HOT_MODELS)
+        self.assertEqual([message.id for message in messages], expected)
+
+    def test_add_index(self):
+        index = models.Index(fields=["date_joined"], name="date_joined_idx")
+
+        self.assertCheckIds(
+            make_migration([migrations.AddIndex("customuser", index)]),
+            ["zero_downtime.W001"],
+        )
+        self.assertCheckIds(
+            make_migration(
+                [AddIndexConcurrently("customuser", index)], atomic=False
+            ),
+            [],
+        )
+
+    def test_concurrent_operation_in_atomic_migration(self):
+        self.assertCheckIds(
+            make_migration([SetNotNull("customuser", "bio")]),
+            ["zero_downtime.W005"],
+        )
+
+    def test_add_field(self):
+        self.assertCheckIds(
+            make_migration(
+                [
+                    migrations.AddField(
+                        "customuser", "bio", models.TextField(default="")
+                    )
+                ]
+            ),
+            ["zero_downtime.W002"],
+        )
+        self.assertCheckIds(
+            make_migration(
+                [
+                    migrations.AddField(
+                        "customuser", "bio", models.TextField(null=True)
+                    )
+                ]
+            ),
+            [],
+        )
+
+    def test_alter_field(self):
+        self.assertCheckIds(
+            make_migration(
+                [
+                    migrations.AlterField(
+                        "customuser",
+                        "first_name",
+                        models.CharField(max_length=50),
+                    )
+                ]
+            ),
+            ["zero_downtime.W003"],
+        )
+
+    def test_ignores_other_models(self):
+        self.assertCheckIds(
+            make_migration(
+                [
+                    migrations.AddField(
+                        "post", "bio", models.TextField(default="")
+                    )
+                ]
+            ),
+            [],
+        )
+
+    def test_ignored_migration(self):
+        index = models.Index(fields=["date_joined"], name="date_joined_idx")
+        migration = make_migration([migrations.AddIndex("customuser", index)])
+        setattr(migration, "zero_downtime_ignore", True)
+
+        self.assertCheckIds(migration, [])
@@ -0,0 +1,57 @@
+from django.apps import apps
+from django.db import connection
+from django.db.migrations.state import ProjectState
+from django.test import TransactionTestCase
+
+from apps.users.models import CustomUser
+from apps.zero_downtime.operations import SetNotNull
+
+
+class SetNotNullTests(TransactionTestCase):
+    def setUp(self):
+        self.operation = SetNotNull("customuser", "updated_at")
+        self.from_state = ProjectState.from_apps(apps)
+        self.to_state = self.from_state.clone()
+        self.operation.state_forwards("users", self.to_state)
+
+    def describe_column(self) -> tuple[bool, list[str]]:
+        table = CustomUser._meta.db_table
+        with connection.cursor() as cursor:
+            null_ok = next(
+                column.null_ok
+                for column in connection.introspection.get_table_description(
+                    cursor, table
+                )
+                if column.name == "updated_at"
+            )
+            constraints = list(
+                connection.introspection.get_constraints(cursor, table)
+            )
+        return bool(null_ok), constraints
+
+    def test_forwards_and_backwards(self):
+        with connection.schema_editor(atomic=False) as editor:
+            self.operation.database_forwards(
+                "users", editor, self.from_state, self.to_state
+            )
+        try:
+            null_ok, constraints = self.describe_column()
+            self.assertFalse(null_ok)
+            self.assertFalse(
+                [name for name in constraints if name.endswith("_notnull")]
+            )
+        finally:
+            with connection.schema_editor(atomic=False) as editor:
+                self.operation.database_backwards(
+                    "users", editor, self.to_state, self.from_state
+                )
+
+        null_ok, _ = self.describe_column()
+        self.assertTrue(null_ok)
+
+    def test_state_forwards(self):
+        field = self.to_state.models["users", "customuser"].fields[
+            "updated_at"
+        ]
+
+        self.assertFalse(field.null)
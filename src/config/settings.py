@@ -51,6 +51,9 @@ INSTALLED_APPS = [
     "drf_spectacular",
     "django_extensions",
     "apps.health",
+    "apps.profiling",
+    "apps.zero_downtime",
+    "apps.load_shedding",
 ]
 
 REST_FRAMEWORK = {
@@ -72,11 +75,14 @@ SPECTACULAR_SETTINGS = {
 }
 
 MIDDLEWARE = [
+    "apps.load_shedding.middleware.LoadSheddingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.profiling.middleware.ProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -178,6 +184,31 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "users.CustomUser"
 
+# Idempotency-Key support
+IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", 60 * 60 * 24))
+# Must stay well above the slowest sign-up (password hashing plus SMTP),
+# otherwise a retry may run the handler while the first request is alive
+IDEMPOTENCY_LOCK_TIMEOUT = int(os.getenv("IDEMPOTENCY_LOCK_TIMEOUT", 5 * 60))
+IDEMPOTENCY_WAIT_TIMEOUT = int(os.getenv("IDEMPOTENCY_WAIT_TIMEOUT", 10))
+
+# Batch user lookup
+USERS_LOOKUP_MAX_KEYS = int(os.getenv("USERS_LOOKUP_MAX_KEYS", 100))
+USERS_LOOKUP_CACHE_TTL = int(os.getenv("USERS_LOOKUP_CACHE_TTL", 30))
+USERS_LOOKUP_CACHE = "users_lookup"
+
+# The batch lookup cache is per worker, writing one row per user to a
+# shared database cache would cost more queries than it saves.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    USERS_LOOKUP_CACHE: {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "users-lookup",
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    },
+}
+
 # Media setup
 MEDIA_URL = os.getenv("MEDIA_URL", "/media/")
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
@@ -192,3 +223,46 @@ EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.environ["SES_SMTP_USERNAME"]
 EMAIL_HOST_PASSWORD = os.environ["SES_SMTP_PASSWORD"]
 DEFAULT_FROM_EMAIL = os.environ["SES_VERIFIED_EMAIL"]
+
+# On-demand request profiling
+PROFILING_REPORTS_DIR = os.getenv(
+    "PROFILING_REPORTS_DIR", os.path.join(BASE_DIR, "profiles")
+)
+PROFILING_MAX_REPORTS = int(os.getenv("PROFILING_MAX_REPORTS", 50))
+PROFILING_TOKEN_MAX_AGE = int(os.getenv("PROFILING_TOKEN_MAX_AGE", 60 * 60))
+
+# Models whose tables are too large to lock during migrations
+ZERO_DOWNTIME_HOT_MODELS = ["users.CustomUser"]
+
+# Incremental user export, seconds re-read before the cursor to catch rows
+# committed after a later timestamp was already exported
+USERS_EXPORT_OVERLAP = int(os.getenv("USERS_EXPORT_OVERLAP", 5 * 60))
+
+# Per-worker concurrency limits. Requests matching a LOAD_SHEDDING_ROUTES
+# prefix use that lane, everything else uses the default one. Lanes only
+# limit requests that already hold a server thread, so the server's thread
+# pool must be at least the default LIMIT plus the reserved LIMIT per
+# worker. With fewer threads, default requests can take all of them and
+# the reserved routes queue at the server before reaching their lane.
+LOAD_SHEDDING_LANES = {
+    "default": {
+        "LIMIT": int(os.getenv("LOAD_SHEDDING_LIMIT", 16)),
+        "QUEUE_TIMEOUT": float(os.getenv("LOAD_SHEDDING_QUEUE_TIMEOUT", 1)),
+    },
+    "reserved": {
+        "LIMIT": int(os.getenv("LOAD_SHEDDING_RESERVED_LIMIT", 4)),
+        "QUEUE_TIMEOUT": float(
+            os.getenv("LOAD_SHEDDING_RESERVED_QUEUE_TIMEOUT", 0.5)
+        ),
+    },
+}
+LOAD_SHEDDING_ROUTES = {
+    "/api/health": "reserved",
+    "/api/load-shedding/": "reserved",
+    "/admin/": "reserved",
+}
+LOAD_SHEDDING_RETRY_AFTER = int(os.getenv("LOAD_SHEDDING_RETRY_AFTER", 1))
+
+# Query budgets checked by the test suite
+QUERY_BUDGET_FILE = os.path.join(BASE_DIR, "query_budgets.json")
+QUERY_BUDGET_REPEAT_THRESHOLD = 3
@@ -20,8 +20,10 @@ from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
 urlpatterns = [
+    path("admin/profiling/", include("apps.profiling.urls")),
     path("admin/", admin.site.urls),
     path("api/", include("apps.health.urls")),
+    path("api/", include("apps.load_shedding.urls")),
     path(
         "api/schema/",
         SpectacularAPIView.as_view(),